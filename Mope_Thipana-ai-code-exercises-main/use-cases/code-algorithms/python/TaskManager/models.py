@@ -1,8 +1,29 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 import uuid
 
 
+# Tags that mark a task as urgent for priority scoring
+URGENT_TAGS = frozenset(("blocker", "critical", "urgent"))
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def wall_clock_microseconds(value):
+    """
+    Whole microseconds from a naive 1970-01-01 to the naive datetime `value`.
+
+    Unlike value.timestamp(), this counts wall-clock time the same way
+    subtracting two naive datetimes does, so day counts don't shift by an
+    hour across a DST change (and out-of-range local dates don't raise).
+    The result is an exact int, so `// MICROSECONDS_PER_DAY` on a difference
+    gives the same day count as timedelta.days.
+    """
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
 class TaskPriority(Enum):
     LOW = 1
     MEDIUM = 2
@@ -29,6 +50,39 @@ class Task:
         self.completed_at = None
         self.tags = tags or []
 
+    # due_date and updated_at also cache their wall-clock microseconds
+    # (_due_us, _updated_us) so scorers can do plain int math instead of
+    # building timedelta objects. The datetimes stay in __dict__ under their own names.
+    @property
+    def due_date(self):
+        return self.__dict__['due_date']
+
+    @due_date.setter
+    def due_date(self, value):
+        self.__dict__['due_date'] = value
+        self._due_us = wall_clock_microseconds(value) if value else None
+
+    # Invariant: _is_urgent always reflects the current tags. It is only
+    # refreshed on assignment, so replace the list rather than mutating it
+    # in place (task.tags = [...], not task.tags.append(...)).
+    @property
+    def tags(self):
+        return self.__dict__['tags']
+
+    @tags.setter
+    def tags(self, value):
+        self.__dict__['tags'] = value
+        self._is_urgent = bool(value) and not URGENT_TAGS.isdisjoint(value)
+
+    @property
+    def updated_at(self):
+        return self.__dict__['updated_at']
+
+    @updated_at.setter
+    def updated_at(self, value):
+        self.__dict__['updated_at'] = value
+        self._updated_us = wall_clock_microseconds(value)
+
     def update(self, **kwargs):
         for key, value in kwargs.items():
             if hasattr(self, key):
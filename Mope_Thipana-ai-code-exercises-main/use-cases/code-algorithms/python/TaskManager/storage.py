@@ -7,7 +7,9 @@ from models import Task, TaskPriority, TaskStatus
 class TaskEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Task):
-            task_dict = obj.__dict__.copy()
+            # Skip private cached fields (e.g. _due_us); they are rebuilt on load
+            task_dict = {key: value for key, value in obj.__dict__.items()
+                         if not key.startswith('_')}
             task_dict['priority'] = obj.priority.value
             task_dict['status'] = obj.status.value
             # Convert datetime objects to ISO format strings
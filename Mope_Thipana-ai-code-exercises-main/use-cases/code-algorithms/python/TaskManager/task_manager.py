@@ -71,7 +71,8 @@ class TaskManager:
         task = self.storage.get_task(task_id)
         if task:
             if tag not in task.tags:
-                task.tags.append(tag)
+                # Reassign so the task refreshes its cached urgency flag
+                task.tags = task.tags + [tag]
                 self.storage.save()
             return True
         return False
@@ -79,7 +80,7 @@ class TaskManager:
     def remove_tag_from_task(self, task_id, tag):
         task = self.storage.get_task(task_id)
         if task and tag in task.tags:
-            task.tags.remove(tag)
+            task.tags = [t for t in task.tags if t != tag]
             self.storage.save()
             return True
         return False
@@ -0,0 +1,228 @@
+"""
+BATCH VERSION: Scores a whole collection of tasks in one vectorized pass.
+Same rules as calculate_task_score_refactored, but the fields are packed into
+parallel NumPy arrays (one per field) so the arithmetic runs in C, not per task.
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from models import TaskStatus, TaskPriority, MICROSECONDS_PER_DAY, wall_clock_microseconds
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba not installed: use the pure NumPy path
+    njit = None
+
+
+# Invariant: every score lies in [0 - 50, 60 + 35 + 8 + 5] = [-50, 108]
+# (a missing priority has a base of 0), so scores are stored as int16
+# (2 bytes each) instead of int32/int64
+SCORE_DTYPE = np.int16
+SCORE_MIN = -50
+SCORE_MAX = 108
+
+# Priority codes (the enum value; unknown or missing priority -> 0) and the
+# base score for each code
+PRIORITY_CODE = {priority: priority.value for priority in TaskPriority}
+PRIORITY_SCORE_LUT = np.array([0, 10, 20, 40, 60], dtype=SCORE_DTYPE)
+
+# Status codes and the penalty for each code (unknown status -> 0, no penalty)
+STATUS_CODE = {
+    TaskStatus.TODO: 0,
+    TaskStatus.IN_PROGRESS: 1,
+    TaskStatus.REVIEW: 2,
+    TaskStatus.DONE: 3,
+}
+STATUS_PENALTY_LUT = np.array([0, 0, -15, -50], dtype=SCORE_DTYPE)
+
+# Wall-clock microseconds are kept as exact int64 (float64 would round them
+# past 2**53); this sentinel marks a task with no due date
+NO_DUE_DATE = np.iinfo(np.int64).max
+
+
+def _due_date_bonus_branchless(days_until_due):
+    """
+    Due date bonus as a sum of comparison results, with no branches:
+        days < 0 -> 35, days == 0 -> 20, days <= 2 -> 15, days <= 7 -> 10, else 0
+
+    Works on a scalar or a whole array. NaN (no due date) fails every
+    comparison and gets 0.
+    """
+    d = days_until_due
+    return (35 * (d < 0)
+            + 20 * (d == 0)
+            + 15 * ((d > 0) & (d <= 2))
+            + 10 * ((d > 2) & (d <= 7)))
+
+
+def _pack_task_columns(tasks):
+    """Extract the fields the scorer needs into parallel NumPy arrays."""
+    n = len(tasks)
+    priority = np.fromiter((PRIORITY_CODE.get(t.priority, 0) for t in tasks), dtype=np.int8, count=n)
+    status = np.fromiter((STATUS_CODE.get(t.status, 0) for t in tasks), dtype=np.int8, count=n)
+    # Tasks cache their wall-clock microseconds (see models.Task)
+    due_us = np.fromiter(
+        (NO_DUE_DATE if t._due_us is None else t._due_us for t in tasks),
+        dtype=np.int64, count=n,
+    )
+    updated_us = np.fromiter((t._updated_us for t in tasks), dtype=np.int64, count=n)
+    urgent = np.fromiter((t._is_urgent for t in tasks), dtype=np.int8, count=n)
+    return priority, status, due_us, updated_us, urgent
+
+
+def _score_columns_numpy(priority, days_until_due, status, urgent, days_since_update):
+    """Score packed columns with vectorized NumPy operations."""
+    # COMPONENT 1: Base priority score
+    scores = PRIORITY_SCORE_LUT[priority]
+
+    # COMPONENT 2: Due date urgency bonus
+    scores += _due_date_bonus_branchless(days_until_due)
+
+    # COMPONENT 3: Status penalty
+    scores += np.take(STATUS_PENALTY_LUT, status)
+
+    # COMPONENT 4: Tag-based boost
+    scores += 8 * urgent
+
+    # COMPONENT 5: Recency bonus (updated within the last 24 hours)
+    scores += 5 * (days_since_update < 1)
+
+    return scores
+
+
+if njit is not None:
+    _due_date_bonus_jit = njit(inline='always')(_due_date_bonus_branchless)
+
+    @njit(cache=True, parallel=True)
+    def _score_kernel(priority, days_until_due, status, urgent, days_since_update, out):
+        """Compiled per-task scoring loop, run across cores with prange."""
+        for i in prange(priority.shape[0]):
+            score = PRIORITY_SCORE_LUT[priority[i]]
+            score += _due_date_bonus_jit(days_until_due[i])
+            score += STATUS_PENALTY_LUT[status[i]]
+            score += 8 * urgent[i]
+            score += 5 * (days_since_update[i] < 1)
+            out[i] = score
+
+    # Compile once at import (or load from the on-disk cache) so the first
+    # ranking call doesn't pay the JIT cost
+    _score_kernel(
+        np.ones(1, dtype=np.int8), np.zeros(1, dtype=np.float64), np.zeros(1, dtype=np.int8),
+        np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int64), np.empty(1, dtype=SCORE_DTYPE),
+    )
+else:
+    _score_kernel = None
+
+
+def _score_columns(priority, status, due_us, updated_us, urgent):
+    """Score packed columns, reading the clock once for the whole batch."""
+    now_us = wall_clock_microseconds(datetime.now())
+    # Exact integer floor division, like timedelta.days; no due date -> NaN
+    days_until_due = np.where(due_us == NO_DUE_DATE, np.nan, (due_us - now_us) // MICROSECONDS_PER_DAY)
+    days_since_update = (now_us - updated_us) // MICROSECONDS_PER_DAY
+
+    if _score_kernel is not None:
+        scores = np.empty(len(priority), dtype=SCORE_DTYPE)
+        _score_kernel(priority, days_until_due, status, urgent, days_since_update, scores)
+    else:
+        scores = _score_columns_numpy(priority, days_until_due, status, urgent, days_since_update)
+
+    # Debug check of the int16 range invariant (skipped under python -O)
+    assert len(scores) == 0 or (SCORE_MIN <= scores.min() and scores.max() <= SCORE_MAX)
+    return scores
+
+
+def calculate_task_scores_batch(tasks):
+    """
+    Calculate the priority score for every task in one pass.
+
+    Returns a NumPy int16 array with one score per task, in the same order
+    as the input. Scores match calculate_task_score_refactored.
+    Uses the Numba kernel when Numba is installed, NumPy otherwise.
+    """
+    return _score_columns(*_pack_task_columns(list(tasks)))
+
+
+class TaskScoreView:
+    """
+    Columnar copy of the task fields the scorer reads, for scoring a large
+    task list repeatedly without touching the Task objects.
+
+    Each field lives in its own contiguous array (one row per task). The
+    caller keeps the view in sync: call add() for new or changed tasks and
+    remove() for deleted ones. scores() lines up with task_ids.
+    """
+
+    _COLUMNS = (
+        ("priority", np.int8),
+        ("status", np.int8),
+        ("due_us", np.int64),
+        ("updated_us", np.int64),
+        ("urgent", np.int8),
+    )
+
+    def __init__(self, tasks=()):
+        self._rows = {}  # task id -> row index
+        self._ids = []
+        self._size = 0
+        self._columns = {name: np.empty(8, dtype=dtype) for name, dtype in self._COLUMNS}
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def task_ids(self):
+        return list(self._ids)
+
+    def add(self, task):
+        """Add a task, or refresh its row if the task is already in the view."""
+        row = self._rows.get(task.id)
+        if row is None:
+            if self._size == len(self._columns["priority"]):
+                self._grow()
+            row = self._size
+            self._rows[task.id] = row
+            self._ids.append(task.id)
+            self._size += 1
+
+        columns = self._columns
+        columns["priority"][row] = PRIORITY_CODE.get(task.priority, 0)
+        columns["status"][row] = STATUS_CODE.get(task.status, 0)
+        columns["due_us"][row] = NO_DUE_DATE if task._due_us is None else task._due_us
+        columns["updated_us"][row] = task._updated_us
+        columns["urgent"][row] = task._is_urgent
+
+    update = add
+
+    def remove(self, task_id):
+        """Remove a task by moving the last row into its slot. Returns False if unknown."""
+        row = self._rows.pop(task_id, None)
+        if row is None:
+            return False
+
+        last = self._size - 1
+        if row != last:
+            for column in self._columns.values():
+                column[row] = column[last]
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._ids.pop()
+        self._size = last
+        return True
+
+    def scores(self):
+        """Score every task in the view; the result lines up with task_ids."""
+        n = self._size
+        columns = self._columns
+        return _score_columns(*(columns[name][:n] for name, _ in self._COLUMNS))
+
+    def _grow(self):
+        for name, column in self._columns.items():
+            grown = np.empty(2 * len(column), dtype=column.dtype)
+            grown[:len(column)] = column
+            self._columns[name] = grown
@@ -9,6 +9,21 @@ from models import TaskPriority, TaskStatus, Task
 # Import the scoring functions
 from task_priority import calculate_task_score
 
+# One clock snapshot shared by every experiment, so runs are repeatable
+NOW = datetime.now()
+
+
+def _mk(priority, **overrides):
+    """
+    Build a baseline task (no due date, no tags, updated at NOW) and apply
+    only the fields an experiment cares about.
+    """
+    task = Task(title=f"Task with {priority.name} priority", priority=priority, due_date=None, tags=[])
+    task.updated_at = NOW
+    for field, value in overrides.items():
+        setattr(task, field, value)  # Setters keep the task's cached scoring fields in sync
+    return task
+
 def experiment_1_baseline_scores():
     """
     EXPERIMENT 1: What are the raw base scores?
@@ -22,15 +37,8 @@ def experiment_1_baseline_scores():
     print("(All tasks: no due date, ACTIVE status, no tags, recently updated)\n")
     
     for priority in [TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.HIGH, TaskPriority.URGENT]:
-        task = Task(
-            title=f"Task with {priority.name} priority",
-            description="",
-            priority=priority,
-            due_date=None,  # No due date factor
-            tags=[]         # No tag boosts
-        )
-        # Simulate "recently updated" to avoid update time penalty
-        task.updated_at = datetime.now()
+        # No due date, no tags, recently updated (see _mk)
+        task = _mk(priority)
         
         score = calculate_task_score(task)
         print(f"{priority.name:8} priority → Score: {score}")
@@ -52,14 +60,11 @@ def experiment_2_multiplier_impact():
     print("\n=== EXPERIMENT 2: Does Multiplier Affect Ranking? ===\n")
     
     tasks = [
-        Task(title="Low Priority Task", priority=TaskPriority.LOW, due_date=None, tags=[]),
-        Task(title="Medium Priority Task", priority=TaskPriority.MEDIUM, due_date=None, tags=[]),
-        Task(title="High Priority Task", priority=TaskPriority.HIGH, due_date=None, tags=[]),
+        _mk(TaskPriority.LOW, title="Low Priority Task"),
+        _mk(TaskPriority.MEDIUM, title="Medium Priority Task"),
+        _mk(TaskPriority.HIGH, title="High Priority Task"),
     ]
     
-    for task in tasks:
-        task.updated_at = datetime.now()
-    
     scores = [calculate_task_score(task) for task in tasks]
     
     print("Current scores (multiplier=10):")
@@ -82,13 +87,7 @@ def experiment_3_default_value():
     print("\n=== EXPERIMENT 3: Default Value Behavior ===\n")
     
     # Create a task with a valid priority first
-    normal_task = Task(
-        title="Normal Task",
-        priority=TaskPriority.HIGH,
-        due_date=None,
-        tags=[]
-    )
-    normal_task.updated_at = datetime.now()
+    normal_task = _mk(TaskPriority.HIGH, title="Normal Task")
     
     normal_score = calculate_task_score(normal_task)
     print(f"Normal HIGH priority task score: {normal_score}")
@@ -133,13 +132,7 @@ def experiment_5_compare_with_other_factors():
     """
     print("\n=== EXPERIMENT 5: Priority vs. Other Scoring Factors ===\n")
     
-    base_task = Task(
-        title="Test Task",
-        priority=TaskPriority.LOW,
-        due_date=None,
-        tags=[]
-    )
-    base_task.updated_at = datetime.now()
+    base_task = _mk(TaskPriority.LOW, title="Test Task")
     
     # LOW priority baseline
     low_baseline = calculate_task_score(base_task)
@@ -147,7 +140,7 @@ def experiment_5_compare_with_other_factors():
     
     # Now make the same task OVERDUE (which adds 35 points)
     base_task.priority = TaskPriority.URGENT
-    base_task.due_date = datetime.now() - timedelta(days=1)  # 1 day overdue
+    base_task.due_date = NOW - timedelta(days=1)  # 1 day overdue
     urgent_overdue = calculate_task_score(base_task)
     
     print(f"URGENT + OVERDUE score: {urgent_overdue}")
@@ -0,0 +1,91 @@
+"""Shared fixtures for the priority scoring tests."""
+import os
+import time
+from datetime import datetime, timedelta
+
+from models import Task, TaskStatus, TaskPriority
+
+
+def use_timezone(testcase, tz_name):
+    """
+    Switch the process's local timezone for the rest of a test.
+
+    The original zone is restored through testcase.addCleanup.
+    """
+    old_tz = os.environ.get('TZ')
+
+    def restore():
+        if old_tz is None:
+            os.environ.pop('TZ', None)
+        else:
+            os.environ['TZ'] = old_tz
+        time.tzset()
+
+    os.environ['TZ'] = tz_name
+    time.tzset()
+    testcase.addCleanup(restore)
+
+
+# Score of the task from build_dst_task: 20 (MEDIUM) + 15 (due in 1-2 days)
+# + 5 (recently updated)
+DST_TASK_SCORE = 40
+
+
+def build_dst_task(testcase):
+    """
+    Switch to America/New_York for the rest of a test and build a task due
+    just across the 2026-03-08 spring-forward change. Returns (now, task).
+
+    Only 23.5 real hours pass before the due date, but on the wall clock
+    it is still 1 day and 30 minutes away.
+    """
+    use_timezone(testcase, 'America/New_York')
+    now = datetime(2026, 3, 7, 23, 30)
+    task = Task("DST Task", priority=TaskPriority.MEDIUM, due_date=datetime(2026, 3, 9, 0, 0))
+    task.updated_at = now
+    return now, task
+
+
+# A `now` where float seconds since 1970 lose the exact day count: now and
+# now + 8 days fall on different sides of 2**31 seconds (2038-01-19), and
+# the rounded difference comes out as 7 days
+FLOAT_PRECISION_NOW = datetime(2038, 1, 11, 3, 20, 55, 608741)
+
+# Whole-day offsets that straddle each due date threshold (< 0, 0, <= 2, <= 7, 8+)
+DUE_DAY_OFFSETS = (-5, -1, 0, 1, 2, 3, 7, 8)
+
+
+def build_scoring_tasks(now):
+    """
+    Build one task for every combination of scoring factors, relative to `now`.
+
+    Due dates sit an hour past, exactly on, and 10 seconds short of each
+    whole-day offset, and update times sit on both sides of the 24-hour
+    recency window, so every threshold edge is exercised.
+    """
+    due_dates = [None]
+    for days in DUE_DAY_OFFSETS:
+        due_dates += [
+            now + timedelta(days=days, hours=1),
+            now + timedelta(days=days),
+            now + timedelta(days=days, seconds=-10),
+        ]
+    tag_sets = [[], ["work"], ["work", "critical"], ["blocker"]]
+    updated_ats = [
+        now - timedelta(hours=1),
+        now - timedelta(days=1, seconds=-10),
+        now - timedelta(days=1),
+        now - timedelta(days=2),
+    ]
+
+    tasks = []
+    for priority in list(TaskPriority) + [None]:
+        for status in TaskStatus:
+            for due_date in due_dates:
+                for tags in tag_sets:
+                    for updated_at in updated_ats:
+                        task = Task("Task", priority=priority, due_date=due_date, tags=tags)
+                        task.status = status
+                        task.updated_at = updated_at
+                        tasks.append(task)
+    return tasks
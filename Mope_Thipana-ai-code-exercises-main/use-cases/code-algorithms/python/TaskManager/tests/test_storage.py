@@ -0,0 +1,36 @@
+import json
+import os
+import tempfile
+import unittest
+
+from storage import TaskStorage
+
+
+class TaskStorageTest(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary directory for the storage file."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.storage_path = os.path.join(tmp_dir.name, "tasks.json")
+
+    def test_load_task_with_null_tags(self):
+        """Test that a stored task with "tags": null still loads, and is not urgent."""
+        with open(self.storage_path, 'w') as f:
+            json.dump([{
+                "id": "task_id_1",
+                "title": "Null Tags Task",
+                "priority": 2,
+                "status": "todo",
+                "tags": None,
+            }], f)
+
+        storage = TaskStorage(self.storage_path)
+
+        task = storage.get_task("task_id_1")
+        self.assertIsNotNone(task)
+        self.assertIsNone(task.tags)
+        self.assertFalse(task._is_urgent)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -84,6 +84,25 @@ class TaskManagerTest(unittest.TestCase):
         self.assertEqual(len(updated_task.tags), 1)
         self.assertIn("existing_tag", updated_task.tags)
 
+    def test_add_and_remove_tag_refreshes_urgency(self):
+        """
+        Test that adding or removing an urgent tag keeps the task's cached
+        urgency flag (used by priority scoring) in sync with its tags.
+        """
+        task_manager = TaskManager()
+        task = Task("Test Task", tags=["work"])
+        task_manager.storage.get_task = Mock(return_value=task)
+        task_manager.storage.save = Mock()
+
+        self.assertFalse(task._is_urgent)
+
+        task_manager.add_tag_to_task(task.id, "blocker")
+        self.assertTrue(task._is_urgent)
+
+        task_manager.remove_tag_from_task(task.id, "blocker")
+        self.assertFalse(task._is_urgent)
+        self.assertEqual(task.tags, ["work"])
+
     def test_create_task_2(self):
         """
         Test creating a task without a due date.
@@ -1,9 +1,11 @@
+import time
 import unittest
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from models import Task, TaskStatus, TaskPriority
 from task_priority import calculate_task_score, sort_tasks_by_importance, get_top_priority_tasks
+from tests.scoring_fixtures import DST_TASK_SCORE, FLOAT_PRECISION_NOW, build_dst_task, build_scoring_tasks
 
 
 class TaskPriorityTest(unittest.TestCase):
@@ -151,6 +153,43 @@ class TaskPriorityTest(unittest.TestCase):
         # Verify that recently updated tasks have higher scores
         self.assertGreater(recent_score, older_score)
 
+    @patch('task_priority.datetime')
+    def test_calculate_task_score_reads_cached_urgency(self, mock_datetime):
+        """Test that scoring and ranking both read the urgency flag cached when tags are assigned."""
+        mock_datetime.now.return_value = self.now
+
+        mutated_task = Task("Mutated Tags Task", priority=TaskPriority.MEDIUM, tags=["work"])
+        mutated_task.updated_at = self.now
+        mutated_task.tags.append("blocker")  # In place: the cached flag is not refreshed
+        reassigned_task = Task("Reassigned Tags Task", priority=TaskPriority.MEDIUM, tags=["work"])
+        reassigned_task.updated_at = self.now
+        reassigned_task.tags = reassigned_task.tags + ["blocker"]
+
+        self.assertEqual(calculate_task_score(mutated_task), 20 + 5)
+        self.assertEqual(calculate_task_score(reassigned_task), 20 + 8 + 5)
+        self.assertEqual(["Reassigned Tags Task", "Mutated Tags Task"],
+                         [task.title for task in sort_tasks_by_importance([mutated_task, reassigned_task])])
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "time.tzset is not available")
+    @patch('task_priority.datetime')
+    def test_calculate_task_score_due_date_across_dst(self, mock_datetime):
+        """Test that day counts use wall-clock time when a DST change falls before the due date."""
+        now, task = build_dst_task(self)
+        mock_datetime.now.return_value = now
+
+        self.assertEqual(calculate_task_score(task), DST_TASK_SCORE)
+
+    @patch('task_priority.datetime')
+    def test_calculate_task_score_exact_day_count(self, mock_datetime):
+        """Test that a task due exactly 8 days out counts as 8 days where float seconds would round to 7."""
+        mock_datetime.now.return_value = FLOAT_PRECISION_NOW
+
+        task = Task("Week Task", priority=TaskPriority.MEDIUM, due_date=FLOAT_PRECISION_NOW + timedelta(days=8))
+        task.updated_at = FLOAT_PRECISION_NOW - timedelta(days=2)
+
+        # 20 (MEDIUM) + 0 (8+ days away)
+        self.assertEqual(calculate_task_score(task), 20)
+
     def test_sort_tasks_by_importance(self):
         """Test that sort_tasks_by_importance correctly sorts tasks by their calculated scores."""
         # Create tasks with different characteristics that will affect their scores
@@ -187,6 +226,31 @@ class TaskPriorityTest(unittest.TestCase):
         # Done task should be last regardless of priority
         self.assertEqual("Medium Priority Done", sorted_tasks[4].title)
 
+    def test_sort_tasks_by_importance_accepts_any_iterable(self):
+        """Test that sorting works on a non-indexable iterable and on tasks without a priority."""
+        no_priority_task = Task("No Priority", priority=None)
+        urgent_task = Task("Urgent Priority", priority=TaskPriority.URGENT)
+        tasks_by_id = {task.id: task for task in [no_priority_task, urgent_task]}
+
+        sorted_tasks = sort_tasks_by_importance(tasks_by_id.values())
+
+        self.assertEqual(["Urgent Priority", "No Priority"], [task.title for task in sorted_tasks])
+        self.assertEqual(5, calculate_task_score(no_priority_task))  # Only the recency bonus
+
+    @patch('task_priority.calculate_task_scores_batch', None)
+    @patch('task_priority.datetime')
+    def test_sort_tasks_by_importance_per_task_path(self, mock_datetime):
+        """Test the per-task ranking used without NumPy: highest score first, ties in input order."""
+        mock_datetime.now.return_value = self.now
+        tasks = build_scoring_tasks(self.now)
+
+        sorted_tasks = sort_tasks_by_importance(tasks)
+
+        input_position = {id(task): i for i, task in enumerate(tasks)}
+        sort_keys = [(-calculate_task_score(task), input_position[id(task)]) for task in sorted_tasks]
+        self.assertEqual(len(sorted_tasks), len(tasks))
+        self.assertEqual(sort_keys, sorted(sort_keys))
+
     def test_get_top_priority_tasks(self):
         """Test that get_top_priority_tasks returns the correct number of highest priority tasks."""
         # Create a list of tasks
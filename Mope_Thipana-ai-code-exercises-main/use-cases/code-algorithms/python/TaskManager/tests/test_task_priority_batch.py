@@ -0,0 +1,110 @@
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from models import TaskStatus
+import task_priority
+from task_priority import calculate_task_score, sort_tasks_by_importance
+from task_priority_REFACTORED import calculate_task_score_refactored
+from tests.scoring_fixtures import DST_TASK_SCORE, FLOAT_PRECISION_NOW, build_dst_task, build_scoring_tasks
+
+try:
+    import numpy as np
+    import task_priority_batch
+    from task_priority_batch import calculate_task_scores_batch, TaskScoreView
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TaskPriorityBatchTest(unittest.TestCase):
+    def setUp(self):
+        """Build one task for every combination of scoring factors."""
+        self.now = datetime.now()
+        self.tasks = build_scoring_tasks(self.now)
+
+    def test_batch_matches_refactored(self):
+        """Test that the batch scorer agrees with the per-task scorer, with and without the Numba kernel."""
+        for kernel in (task_priority_batch._score_kernel, None):
+            with self.subTest(kernel=kernel), \
+                    patch('task_priority_REFACTORED.datetime') as mock_refactored, \
+                    patch('task_priority_batch.datetime') as mock_batch, \
+                    patch.object(task_priority_batch, '_score_kernel', kernel):
+                mock_refactored.now.return_value = self.now
+                mock_batch.now.return_value = self.now
+
+                expected = [calculate_task_score_refactored(task) for task in self.tasks]
+                scores = calculate_task_scores_batch(self.tasks)
+
+                self.assertEqual(scores.dtype, np.int16)
+                self.assertEqual(scores.tolist(), expected)
+
+    def test_batch_matches_calculate_task_score(self):
+        """Test that the batch scorer agrees with task_priority.calculate_task_score, the scorer it replaces."""
+        for now in (self.now, FLOAT_PRECISION_NOW):
+            with self.subTest(now=now), \
+                    patch('task_priority.datetime') as mock_task_priority, \
+                    patch('task_priority_batch.datetime') as mock_batch:
+                mock_task_priority.now.return_value = now
+                mock_batch.now.return_value = now
+                tasks = build_scoring_tasks(now)
+
+                expected = [calculate_task_score(task) for task in tasks]
+                scores = calculate_task_scores_batch(tasks)
+
+                self.assertEqual(scores.tolist(), expected)
+
+    def test_sort_matches_per_task_sort(self):
+        """Test that ranking with the batch scorer gives the same order as the per-task sort."""
+        with patch('task_priority.datetime') as mock_task_priority, \
+                patch('task_priority_batch.datetime') as mock_batch:
+            mock_task_priority.now.return_value = self.now
+            mock_batch.now.return_value = self.now
+
+            batch_order = sort_tasks_by_importance(self.tasks)
+            with patch.object(task_priority, 'calculate_task_scores_batch', None):
+                per_task_order = sort_tasks_by_importance(self.tasks)
+
+        self.assertEqual([task.id for task in batch_order], [task.id for task in per_task_order])
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "time.tzset is not available")
+    @patch('task_priority_batch.datetime')
+    def test_batch_due_date_across_dst(self, mock_datetime):
+        """Test that the batch scorer counts wall-clock days across a DST change."""
+        now, task = build_dst_task(self)
+        mock_datetime.now.return_value = now
+
+        self.assertEqual(calculate_task_scores_batch([task]).tolist(), [DST_TASK_SCORE])
+
+    def test_batch_empty(self):
+        """Test that an empty task list produces an empty score array."""
+        scores = calculate_task_scores_batch([])
+        self.assertEqual(len(scores), 0)
+
+    @patch('task_priority_batch.datetime')
+    def test_score_view_matches_batch(self, mock_datetime):
+        """Test that a TaskScoreView kept in sync through add/update/remove scores like the batch scorer."""
+        mock_datetime.now.return_value = self.now
+
+        view = TaskScoreView(self.tasks)
+        self.assertEqual(len(view), len(self.tasks))
+
+        # Change one task, remove a few (including the last row), add one back
+        changed = self.tasks[5]
+        changed.status = TaskStatus.DONE
+        changed.tags = ["urgent"]
+        view.update(changed)
+        for task in (self.tasks[0], self.tasks[10], self.tasks[-1]):
+            self.assertTrue(view.remove(task.id))
+        self.assertFalse(view.remove("missing"))
+        view.add(self.tasks[0])
+
+        by_id = {task.id: task for task in self.tasks}
+        expected = calculate_task_scores_batch([by_id[task_id] for task_id in view.task_ids])
+        self.assertEqual(len(view), len(self.tasks) - 2)
+        self.assertEqual(view.scores().tolist(), expected.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
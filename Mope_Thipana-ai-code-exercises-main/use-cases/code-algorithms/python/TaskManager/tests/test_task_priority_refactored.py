@@ -0,0 +1,109 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from models import Task, TaskPriority
+from task_priority_REFACTORED import (
+    calculate_due_date_bonus,
+    calculate_recency_bonus,
+    calculate_task_score_original,
+    calculate_task_score_refactored,
+    calculate_task_score_compact,
+    calculate_task_score_fast,
+    calculate_task_score_generated,
+)
+from tests.scoring_fixtures import FLOAT_PRECISION_NOW, build_scoring_tasks
+
+
+class TaskPriorityRefactoredTest(unittest.TestCase):
+    def setUp(self):
+        """Build one task for every combination of scoring factors."""
+        self.now = datetime.now()
+        self.tasks = build_scoring_tasks(self.now)
+
+    @patch('task_priority_REFACTORED.datetime')
+    def test_all_versions_agree(self, mock_datetime):
+        """Test that every scoring version produces the same score for every task."""
+        mock_datetime.now.return_value = self.now
+
+        for task in self.tasks:
+            expected = calculate_task_score_original(task)
+            self.assertEqual(calculate_task_score_refactored(task), expected)
+            self.assertEqual(calculate_task_score_compact(task), expected)
+            self.assertEqual(calculate_task_score_fast(task), expected)
+            self.assertEqual(calculate_task_score_generated(task, self.now), expected)
+
+    def test_due_date_bonus_with_fixed_now(self):
+        """Test the documented due date bonuses against an explicit `now`."""
+        now = datetime(2026, 6, 1, 12, 0)
+
+        self.assertEqual(calculate_due_date_bonus(None, now), 0)
+        self.assertEqual(calculate_due_date_bonus(now - timedelta(days=3), now), 35)   # Overdue
+        self.assertEqual(calculate_due_date_bonus(now - timedelta(seconds=1), now), 35)
+        self.assertEqual(calculate_due_date_bonus(now, now), 20)                       # Due today
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=1), now), 15)   # 1-2 days
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=2), now), 15)
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=3), now), 10)   # Within a week
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=7), now), 10)
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=8), now), 0)    # 8+ days
+
+    def test_due_date_bonus_exact_day_count(self):
+        """Test whole-day offsets where float seconds since 1970 would miscount the days."""
+        now = FLOAT_PRECISION_NOW
+
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=2), now), 15)
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=7), now), 10)
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=8), now), 0)
+        self.assertEqual(calculate_recency_bonus(now - timedelta(days=1), now), 0)
+
+    def test_recency_bonus_with_fixed_now(self):
+        """Test the documented recency bonuses against an explicit `now`."""
+        now = datetime(2026, 6, 1, 12, 0)
+
+        self.assertEqual(calculate_recency_bonus(now, now), 5)
+        self.assertEqual(calculate_recency_bonus(now - timedelta(hours=23, minutes=59), now), 5)
+        self.assertEqual(calculate_recency_bonus(now - timedelta(days=1), now), 0)
+        self.assertEqual(calculate_recency_bonus(now - timedelta(days=5), now), 0)
+
+    @patch('task_priority_REFACTORED.datetime')
+    def test_helpers_default_to_current_time(self, mock_datetime):
+        """Test that the helpers read datetime.now() when `now` is not given."""
+        now = datetime(2026, 6, 1, 12, 0)
+        mock_datetime.now.return_value = now
+
+        self.assertEqual(calculate_due_date_bonus(now + timedelta(days=1)), 15)
+        self.assertEqual(calculate_recency_bonus(now - timedelta(hours=2)), 5)
+        self.assertEqual(calculate_recency_bonus(now - timedelta(days=2)), 0)
+        self.assertEqual(mock_datetime.now.call_count, 3)
+
+    @patch('task_priority_REFACTORED.datetime')
+    def test_due_date_within_a_minute_of_day_boundary(self, mock_datetime):
+        """Test that a task due 10 seconds short of a full day is still due today in every version."""
+        now = datetime(2026, 6, 1, 12, 0, 30)
+        mock_datetime.now.return_value = now
+        task = Task("Boundary Task", priority=TaskPriority.LOW, due_date=now + timedelta(days=1, seconds=-10))
+        task.updated_at = now - timedelta(days=2)
+
+        self.assertEqual(calculate_due_date_bonus(task.due_date, now), 20)
+        for score_fn in (calculate_task_score_original, calculate_task_score_refactored,
+                         calculate_task_score_compact, calculate_task_score_fast):
+            self.assertEqual(score_fn(task), 10 + 20)
+        self.assertEqual(calculate_task_score_generated(task, now), 10 + 20)
+
+    def test_missing_priority_scores_zero_base(self):
+        """Test that every version falls back to a base score of 0 when a task has no priority."""
+        task = Task("No Priority Task", priority=None)
+
+        for score_fn in (calculate_task_score_original, calculate_task_score_refactored,
+                         calculate_task_score_compact, calculate_task_score_fast,
+                         calculate_task_score_generated):
+            self.assertEqual(score_fn(task), 5)  # Only the recency bonus
+
+    def test_generated_reads_clock_by_default(self):
+        """Test that the generated scorer reads the current time when none is given."""
+        task = Task("Task", priority=TaskPriority.HIGH, due_date=datetime.now() + timedelta(days=1, hours=1))
+        self.assertEqual(calculate_task_score_generated(task), 40 + 15 + 5)
+
+
+if __name__ == '__main__':
+    unittest.main()